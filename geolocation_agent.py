@@ -1,9 +1,16 @@
 # geolocation_server/agent.py
 
 from agents import Agent, Runner
-from geolocation_server.server import GeolocationServer
+from geolocation_server.server import geocode, geocode_many, reverse_geocode, nearby_search
 import asyncio
 
+try:
+    # Faster libuv-based event loop when available (not supported on Windows)
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 def build_geolocation_agent(model: str = "gpt-4o-mini") -> Agent:
     """
     Build the geolocation agent.
@@ -19,11 +26,10 @@ def build_geolocation_agent(model: str = "gpt-4o-mini") -> Agent:
 
     Behavior
     --------
-    Registers geocode, reverse geocode, and nearby search tools
-    from a GeolocationServer instance so the agent can route calls.
+    Registers the top-level geocode (single and batch), reverse geocode,
+    and nearby search tools exposed by the server so the agent can route calls.
     """
-    server = GeolocationServer()
-    tools = [server.geocode, server.reverse_geocode, server.nearby_search]
+    tools = [geocode, geocode_many, reverse_geocode, nearby_search]
     agent = Agent(
         name="geolocation_agent",
         model=model,
@@ -31,7 +37,8 @@ def build_geolocation_agent(model: str = "gpt-4o-mini") -> Agent:
         instructions=(
             "You are a geolocation assistant. Use geocoding, reverse geocoding, "
             "and nearby search tools when appropriate. If a coordinate or POI type "
-            "is missing, ask for clarification briefly."
+            "is missing, ask for clarification briefly. When the user asks about "
+            "multiple places, call `geocode_many` once instead of `geocode` repeatedly."
         ),
     )
     return agent
@@ -1,7 +1,15 @@
 import gradio as gr
-import asyncio
+import functools
 from agents import Agent, Runner
-from geolocation_server.server import GeolocationServer
+from openai.types.responses import ResponseTextDeltaEvent
+from geolocation_server.server import geocode, geocode_many, reverse_geocode, nearby_search
+
+try:
+    # Faster libuv-based event loop when available (not supported on Windows)
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # =====================================================================
 # Build agent for the UI
@@ -22,21 +30,15 @@ def build_geolocation_agent() -> Agent:
 
     Behavior
     --------
-    Creates a GeolocationServer instance and registers its tools
-    (geocode, reverse_geocode, nearby_search) with the Agent. The
-    model is instructed to call tools when user prompts require
-    retrieval or spatial reasoning.
+    Registers the top-level server tools (geocode, geocode_many,
+    reverse_geocode, nearby_search) with the Agent. The model is instructed to call
+    tools when user prompts require retrieval or spatial reasoning.
     """
-    server = GeolocationServer()
-
-    # NOTE
-    # ----
-    # We pass the *bound* tool callables from the instance so the
-    # function_tool decorator’s wrapping is preserved.
     tools = [
-        server.geocode,
-        server.reverse_geocode,
-        server.nearby_search,
+        geocode,
+        geocode_many,
+        reverse_geocode,
+        nearby_search,
     ]
 
     return Agent(
@@ -44,62 +46,77 @@ def build_geolocation_agent() -> Agent:
         instructions=(
             "You are a geolocation assistant. Use the provided tools "
             "to geocode names, reverse geocode coordinates, and search "
-            "for nearby points of interest."
+            "for nearby points of interest. When the user asks about "
+            "multiple places, call `geocode_many` once instead of "
+            "`geocode` repeatedly."
         ),
         tools=tools,
         model="gpt-4o-mini",
     )
 
 
-agent = build_geolocation_agent()
-runner = Runner()
-
-# =====================================================================
-# Async / Sync bridge
-# =====================================================================
-
-async def run_agent_async(message: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _agent() -> Agent:
     """
-    Async wrapper around Runner.run.
-
-    Input
-    -----
-    message
-        User input prompt (free-form)
+    Process-wide Agent accessor.
 
     Returns
     -------
-    str
-        Final LLM output text
+    Agent
+        The UI agent, built on first use and reused afterwards
 
     Behavior
     --------
-    Awaits the model response and returns the final string output
-    (Agent’s synthesized answer after any tool calls).
+    Memoizes build_geolocation_agent() so the Agent and its tool
+    schemas are built once per process, lazily on the first request.
     """
-    result = await runner.run(agent, message)
-    return result.final_output  # Agents SDK: final text output
+    return build_geolocation_agent()
 
 
-def run_agent(message: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _runner() -> Runner:
     """
-    Sync entrypoint for Gradio.
+    Process-wide Runner accessor.
+
+    Returns
+    -------
+    Runner
+        Shared Runner instance, created lazily on first use
+    """
+    return Runner()
+
+# =====================================================================
+# Streaming bridge
+# =====================================================================
+
+async def run_agent(message: str):
+    """
+    Streaming entrypoint for Gradio.
 
     Input
     -----
     message
         User input prompt
 
-    Returns
-    -------
+    Yields
+    ------
     str
-        Final LLM output text
+        Answer text accumulated so far
 
     Behavior
     --------
-    Bridges Gradio’s sync call with the async runner using asyncio.run.
+    Runs the agent in streaming mode and yields the growing answer on
+    every text delta, so the UI shows first tokens as soon as they arrive
+    instead of after the whole generation. The last value yielded is the
+    Agent’s final output (after any tool calls).
     """
-    return asyncio.run(run_agent_async(message))
+    result = _runner().run_streamed(_agent(), message)
+    text = ""
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            text += event.data.delta
+            yield text
+    yield result.final_output  # Agents SDK: final text output
 
 
 # =====================================================================
@@ -125,6 +142,7 @@ ui = gr.Interface(
         "Tip: You can paste coordinates or ask for a POI type (e.g., hospital, museum, park)."
     ),
     allow_flagging="never",
+    api_name="ask",
 )
 
 if __name__ == "__main__":
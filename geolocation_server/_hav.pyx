@@ -0,0 +1,63 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+# geolocation_server/_hav.pyx
+#
+# Optional AOT-compiled Haversine kernels. Drop-in replacements for the
+# Numba kernels in server.py (same argument order and units), imported
+# automatically when built:
+#
+#     cythonize -i geolocation_server/_hav.pyx
+
+from cython.parallel import prange
+from libc.math cimport sin, asin, sqrt
+
+
+cpdef double haversine_km(double phi1, double lam1, double cos_phi1,
+                          double phi2, double lam2, double cos_phi2) noexcept nogil:
+    """
+    Compute spherical distance using the Haversine formula.
+
+    Input
+    -----
+    phi1, lam1, cos_phi1
+        First coordinate (radians) and cosine of its latitude
+    phi2, lam2, cos_phi2
+        Second coordinate (radians) and cosine of its latitude
+
+    Returns
+    -------
+    Distance in kilometers
+    """
+    cdef double s1 = sin((phi2 - phi1) / 2.0)
+    cdef double s2 = sin((lam2 - lam1) / 2.0)
+    cdef double a = s1 * s1 + cos_phi1 * cos_phi2 * s2 * s2
+    return 2.0 * 6371.0 * asin(sqrt(a))        # great-circle distance
+
+
+def haversine_many(double phi, double lam, double cos_phi,
+                   const float[::1] lats, const float[::1] lons,
+                   const float[::1] coslats, double[::1] out):
+    """
+    Batch Haversine distance from one point to many.
+
+    Input
+    -----
+    phi, lam, cos_phi
+        Query coordinate (radians) and cosine of its latitude
+    lats, lons, coslats
+        float32 arrays of target coordinates (radians) and latitude cosines
+    out
+        Preallocated float64 array receiving the distances [km]
+
+    Returns
+    -------
+    None (results are written into `out`)
+
+    Behavior
+    --------
+    Releases the GIL and iterates with prange (parallel when the extension
+    is compiled with OpenMP, serial otherwise).
+    """
+    cdef Py_ssize_t i
+    with nogil:
+        for i in prange(lats.shape[0]):
+            out[i] = haversine_km(phi, lam, cos_phi, lats[i], lons[i], coslats[i])
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, asdict
+import functools
 from agents.tool import function_tool as tool
 import math
+import numpy as np
 
 # =====================================================================
 # Server configuration (MCP startup parameters)
@@ -46,133 +48,57 @@ DEFAULT_SERVER_PARAMS = ServerParams(
 
 
 # =====================================================================
-# Geolocation Server
+# POI record
 # =====================================================================
 
-class GeolocationServer:
+@dataclass(slots=True)
+class POI:
     """
-    Geolocation Server.
+    Point-of-interest record.
+
+    Input
+    -----
+    name
+        Display name
+    lat, lon
+        Coordinate in degrees
+    type
+        POI type (e.g., 'hospital', 'museum')
 
     Behavior
     --------
-    Provides tools for:
-      - geocoding (name -> lat/lon),
-      - reverse geocoding (lat/lon -> nearest known place),
-      - nearby search (POIs within a radius by type).
-    Dataset is synthetic but geographically plausible for Lebanon.
+    Compact, slot-based row used by the per-type POI index; nearby_search()
+    only turns the returned rows into dictionaries.
     """
+    name: str
+    lat: float
+    lon: float
+    type: str
 
-    # =================================================================
-    # Synthetic gazetteer + POI database (Lebanon-centric)
-    # =================================================================
-    # NOTE: coordinates are approximate and simplified for assignment use.
-    PLACES = {
-        # Keys are user-friendly names. Values carry lat/lon + metadata
-        "AUB": {"lat": 33.901, "lon": 35.480, "city": "Beirut", "type": "university"},
-        "Beirut": {"lat": 33.8938, "lon": 35.5018, "city": "Beirut", "type": "city"},
-        "Baalbek": {"lat": 34.006, "lon": 36.203, "city": "Baalbek", "type": "city"},
-        "Byblos": {"lat": 34.123, "lon": 35.651, "city": "Byblos", "type": "city"},
-        "Sidon": {"lat": 33.560, "lon": 35.375, "city": "Sidon", "type": "city"},
-        "Tyre": {"lat": 33.270, "lon": 35.196, "city": "Tyre", "type": "city"},
-        "Zahle": {"lat": 33.850, "lon": 35.900, "city": "Zahle", "type": "city"},
-        "Airport": {"lat": 33.8209, "lon": 35.4884, "city": "Beirut", "type": "airport"},
-        "RHUH": {"lat": 33.871, "lon": 35.513, "city": "Beirut", "type": "hospital"},  # Rafik Hariri Univ. Hospital (approx)
-    }
 
-    # Small POI list for nearby search (expanded; Lebanon-centric, approximate coords)
-    # NOTE
-    # ----
-    # - Keep 'type' values consistent with nearby_search() filtering (e.g., 'hospital', 'mall', 'venue', 'university',
-    #   'museum', 'park', 'airport', 'embassy', 'pharmacy', 'restaurant', 'hotel', 'stadium', 'theater', 'beach').
-    # - Coordinates are approximate and simplified for assignment/demo use.
-    POIS = [
-        # --- Hospitals ---
-        {"name": "AUBMC", "lat": 33.896, "lon": 35.478, "type": "hospital"},
-        {"name": "Rafik Hariri Univ. Hospital (RHUH)", "lat": 33.871, "lon": 35.513, "type": "hospital"},
-        {"name": "Hotel-Dieu de France", "lat": 33.8869, "lon": 35.5233, "type": "hospital"},
-        {"name": "LAU Medical Center – Rizk Hospital", "lat": 33.8927, "lon": 35.5159, "type": "hospital"},
-        {"name": "Baalbek Governmental Hospital", "lat": 34.010, "lon": 36.210, "type": "hospital"},
-        {"name": "Zahle Governmental Hospital", "lat": 33.846, "lon": 35.904, "type": "hospital"},
-
-        # --- Universities / Schools ---
-        {"name": "American University of Beirut (AUB)", "lat": 33.901, "lon": 35.480, "type": "university"},
-        {"name": "Lebanese American University (LAU) Beirut", "lat": 33.8957, "lon": 35.4865, "type": "university"},
-        {"name": "Saint Joseph University (USJ) – Huvelin", "lat": 33.8934, "lon": 35.5103, "type": "university"},
-
-        # --- Malls / Shopping ---
-        {"name": "Beirut Souks", "lat": 33.901, "lon": 35.504, "type": "mall"},
-        {"name": "ABC Achrafieh", "lat": 33.886, "lon": 35.521, "type": "mall"},
-        {"name": "ABC Verdun", "lat": 33.883, "lon": 35.486, "type": "mall"},
-        {"name": "City Centre Beirut", "lat": 33.868, "lon": 35.535, "type": "mall"},
-
-        # --- Museums / Culture ---
-        {"name": "National Museum of Beirut", "lat": 33.8833, "lon": 35.5192, "type": "museum"},
-        {"name": "Sursock Museum", "lat": 33.8920, "lon": 35.5171, "type": "museum"},
-        {"name": "Byblos Archaeological Site", "lat": 34.1239, "lon": 35.6518, "type": "museum"},
-        {"name": "Baalbek Roman Temples", "lat": 34.0060, "lon": 36.2030, "type": "museum"},
-
-        # --- Landmarks / Venues / Theaters ---
-        {"name": "Forum de Beyrouth", "lat": 33.898, "lon": 35.535, "type": "venue"},
-        {"name": "Beiteddine Palace (Chouf)", "lat": 33.694, "lon": 35.579, "type": "museum"},
-        {"name": "Roman Hippodrome of Tyre", "lat": 33.263, "lon": 35.205, "type": "museum"},
-        {"name": "Byblos Old Souk", "lat": 34.121, "lon": 35.648, "type": "venue"},
-        {"name": "Al Madina Theatre", "lat": 33.8937, "lon": 35.4867, "type": "theater"},
-
-        # --- Parks / Beaches ---
-        {"name": "Horsh Beirut", "lat": 33.8727, "lon": 35.5053, "type": "park"},
-        {"name": "Rouche (Pigeon Rocks)", "lat": 33.8896, "lon": 35.4703, "type": "park"},
-        {"name": "Tyre Beach (South)", "lat": 33.257, "lon": 35.214, "type": "beach"},
-        {"name": "Ramlet el-Baida Beach", "lat": 33.8749, "lon": 35.4769, "type": "beach"},
-
-        # --- Transport ---
-        {"name": "Beirut–Rafic Hariri International Airport", "lat": 33.8209, "lon": 35.4884, "type": "airport"},
-        {"name": "Charles Helou Bus Station", "lat": 33.8994, "lon": 35.5199, "type": "venue"},
-
-        # --- Hotels / Restaurants / Cafés ---
-        {"name": "Phoenicia Hotel Beirut", "lat": 33.9015, "lon": 35.4900, "type": "hotel"},
-        {"name": "Le Gray (Downtown)", "lat": 33.8967, "lon": 35.5019, "type": "hotel"},
-        {"name": "Tawlet Mar Mikhael", "lat": 33.8968, "lon": 35.5182, "type": "restaurant"},
-        {"name": "Mayrig Gemmayze", "lat": 33.8944, "lon": 35.5148, "type": "restaurant"},
-        {"name": "Zahle Wine House", "lat": 33.8465, "lon": 35.9035, "type": "restaurant"},
-
-        # --- Pharmacies / Embassies / Other utilities ---
-        {"name": "Pharmacy 24/7 Hamra", "lat": 33.8955, "lon": 35.4820, "type": "pharmacy"},
-        {"name": "US Embassy (Awkar - approx)", "lat": 33.956, "lon": 35.589, "type": "embassy"},
-        {"name": "French Embassy (Achrafieh - approx)", "lat": 33.888, "lon": 35.517, "type": "embassy"},
-
-        # --- Sports / Stadiums ---
-        {"name": "Camille Chamoun Sports City Stadium", "lat": 33.859, "lon": 35.494, "type": "stadium"},
-    ]
-
-    # =================================================================
-    # Constructor
-    # =================================================================
-
-    def __init__(self):
-        """
-        Initialize server instance.
-
-        Behavior
-        --------
-        No persistent state is required. Dataset is static.
-        """
-        pass  # nothing to initialize; all data are class-level constants
+# =====================================================================
+# Distance kernels (Numba-compiled, optional Cython override)
+# =====================================================================
 
-    # =================================================================
-    # Internal helpers
-    # =================================================================
+# Prefer the AOT-compiled kernels when the Cython extension has been built
+# (see _hav.pyx); it avoids importing Numba and its first-call compile. The
+# Numba kernels below are the fallback and are only defined when needed.
+try:
+    from geolocation_server._hav import haversine_km as _hav, haversine_many as _hav_many
+except ImportError:
+    from numba import njit
 
-    @staticmethod
-    def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    @njit(cache=True, fastmath=True)
+    def _hav(phi1, lam1, cos_phi1, phi2, lam2, cos_phi2):
         """
         Compute spherical distance using the Haversine formula.
 
         Input
         -----
-        lat1, lon1
-            First coordinate
-        lat2, lon2
-            Second coordinate
+        phi1, lam1, cos_phi1
+            First coordinate (radians) and cosine of its latitude
+        phi2, lam2, cos_phi2
+            Second coordinate (radians) and cosine of its latitude
 
         Returns
         -------
@@ -180,142 +106,628 @@ class GeolocationServer:
 
         Behavior
         --------
-        Used to evaluate spatial proximity for reverse geocoding and nearby search.
+        Compiled to native code by Numba; used to evaluate spatial proximity
+        for reverse geocoding and nearby search. Only the two half-angle sines
+        are evaluated here: radians and latitude cosines are passed in, so the
+        static side is precomputed at import and the query side once per call.
         """
         r = 6371.0                                 # Earth radius [km]
-        dlat = math.radians(lat2 - lat1)           # Δφ in radians
-        dlon = math.radians(lon2 - lon1)           # Δλ in radians
-        a = (math.sin(dlat / 2.0) ** 2
-             + math.cos(math.radians(lat1))
-             * math.cos(math.radians(lat2))
-             * math.sin(dlon / 2.0) ** 2)
+        a = (math.sin((phi2 - phi1) / 2.0) ** 2
+             + cos_phi1 * cos_phi2
+             * math.sin((lam2 - lam1) / 2.0) ** 2)
         return 2.0 * r * math.asin(math.sqrt(a))   # great-circle distance
 
-    # =================================================================
-    # Tools (attached as class attributes to avoid 'self' in JSON schema)
-    # =================================================================
-
-    @tool
-    def geocode(query: str) -> dict:
+    @njit(cache=True, fastmath=True)
+    def _hav_many(phi, lam, cos_phi, lats, lons, coslats, out):
         """
-        Convert a place name to coordinates.
+        Batch Haversine distance from one point to many.
 
         Input
         -----
-        query
-            Place name to resolve (case-insensitive). Examples: "AUB", "Beirut", "Baalbek"
+        phi, lam, cos_phi
+            Query coordinate (radians) and cosine of its latitude
+        lats, lons, coslats
+            Arrays of target coordinates (radians) and their latitude cosines
+        out
+            Preallocated float64 array receiving the distances [km]
 
         Returns
         -------
-        Dictionary containing 'lat' and 'lon' for the first matching place
+        None (results are written into `out`)
 
         Behavior
         --------
-        Performs a simple case-insensitive key or substring match against the internal gazetteer.
-        If multiple places match, returns the best (first) match with basic metadata.
-        """
-        q = query.strip().lower()  # normalize user input
-        # exact key match first (fast path)
-        for name, info in GeolocationServer.PLACES.items():
-            if name.lower() == q:
-                return {"name": name, "lat": info["lat"], "lon": info["lon"], "meta": info}
-
-        # fallback: substring scan in key or city field
-        for name, info in GeolocationServer.PLACES.items():
-            if q in name.lower() or q in info["city"].lower():
-                return {"name": name, "lat": info["lat"], "lon": info["lon"], "meta": info}
-
-        # no match
-        return {"error": f"No match found for '{query}'"}
-
-    @tool
-    def reverse_geocode(lat: float, lon: float) -> dict:
+        Runs the scalar kernel in a compiled loop, avoiding a Python-level
+        call per target.
         """
-        Convert coordinates to the nearest known place.
+        for i in range(lats.shape[0]):
+            out[i] = _hav(phi, lam, cos_phi, lats[i], lons[i], coslats[i])
 
-        Input
-        -----
-        lat
-            Latitude
-        lon
-            Longitude
+    # Warm up the kernels at import so the first tool call does not pay compile time
+    _hav(0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+    _hav_many(0.0, 0.0, 1.0, np.zeros(1, np.float32), np.zeros(1, np.float32),
+              np.ones(1, np.float32), np.empty(1))
 
-        Returns
-        -------
-        Dictionary containing nearest_location (name, city, distance_km)
 
-        Behavior
-        --------
-        Computes Haversine distance to all known places and returns the closest one.
-        """
-        best = None                # (name, info) for best candidate
-        best_d = float("inf")      # track smallest distance
-        for name, info in GeolocationServer.PLACES.items():
-            d = GeolocationServer._haversine_km(lat, lon, info["lat"], info["lon"])
-            if d < best_d:
-                best = (name, info)
-                best_d = d
-
-        if best is None:
-            # Defensive: in case PLACES is empty
-            return {"error": "No places available."}
-
-        name, info = best
-        return {
-            "nearest_location": {
-                "name": name,
-                "city": info["city"],
-                "type": info["type"],
-                "distance_km": round(best_d, 3),
-                "lat": info["lat"],
-                "lon": info["lon"],
-            }
+def _haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Compute spherical distance using the Haversine formula (float64).
+
+    Input
+    -----
+    lat1, lon1
+        First coordinate (degrees)
+    lat2, lon2
+        Second coordinate (degrees)
+
+    Returns
+    -------
+    Distance in kilometers
+
+    Behavior
+    --------
+    Exact reference evaluated from the source coordinates. The float32
+    kernels only shortlist candidates; the few survivors are re-measured
+    here, so radius tests and reported distances keep full precision.
+    """
+    r = 6371.0                                 # Earth radius [km]
+    dlat = math.radians(lat2 - lat1)           # Δφ in radians
+    dlon = math.radians(lon2 - lon1)           # Δλ in radians
+    a = (math.sin(dlat / 2.0) ** 2
+         + math.cos(math.radians(lat1))
+         * math.cos(math.radians(lat2))
+         * math.sin(dlon / 2.0) ** 2)
+    return 2.0 * r * math.asin(math.sqrt(a))   # great-circle distance
+
+
+# Slack [km] absorbing float32 coordinate rounding (< 1 m) in the scans, so
+# the float64 re-check above sees every true hit
+_F32_SLACK_KM = 0.005
+
+
+def _coord_arrays(lats_deg, lons_deg):
+    """
+    Build float32 coordinate arrays with precomputed trig.
+
+    Input
+    -----
+    lats_deg, lons_deg
+        Sequences of latitudes / longitudes in degrees
+
+    Returns
+    -------
+    (lat, lon, cos(lat)) as float32 arrays, coordinates in radians
+
+    Behavior
+    --------
+    Trig is evaluated in float64 and only the results are narrowed. float32
+    resolves ~0.3 m at these latitudes and halves the bytes each distance
+    scan streams through; the arrays only shortlist candidates, whose final
+    test and reported distance come from _haversine_km().
+    """
+    lat = np.radians(np.asarray(lats_deg, dtype=np.float64))
+    lon = np.radians(np.asarray(lons_deg, dtype=np.float64))
+    return tuple(a.astype(np.float32) for a in (lat, lon, np.cos(lat)))
+
+
+# Coarse lat/lon grid used to skip far-away POIs before any distance math.
+# 0.1° cells (~11 km N-S, ~9 km E-W in Lebanon) keep the default 5 km radius
+# inside the query cell + 8 neighbours.
+_GRID_DEG = 0.1
+_GRID_CELL_KM = 6371.0 * math.radians(_GRID_DEG)
+
+
+def _grid_cell(lat, lon):
+    """
+    Return the (row, col) grid cell containing a coordinate in degrees.
+    """
+    return math.floor(lat / _GRID_DEG), math.floor(lon / _GRID_DEG)
+
+
+def _build_grid(members):
+    """
+    Bucket POI rows into grid cells.
+
+    Input
+    -----
+    members
+        List of POI rows of one type
+
+    Returns
+    -------
+    Dictionary mapping (row, col) cell -> array of row indices into `members`
+    """
+    cells = {}
+    for i, poi in enumerate(members):
+        cells.setdefault(_grid_cell(poi.lat, poi.lon), []).append(i)
+    return {cell: np.array(rows, dtype=np.intp) for cell, rows in cells.items()}
+
+
+def _grid_rows(grid, lat, lon, radius_km):
+    """
+    Collect candidate rows from the 3x3 grid neighbourhood of a query.
+
+    Input
+    -----
+    grid
+        Cell -> row indices mapping built by _build_grid()
+    lat, lon
+        Query coordinate (degrees)
+    radius_km
+        Search radius in kilometers
+
+    Returns
+    -------
+    Array of candidate row indices, or None when a full scan is required
+
+    Behavior
+    --------
+    The neighbourhood is only a superset of the true hits when the radius
+    fits inside one cell at the most poleward latitude it reaches, and when
+    it does not cross the antimeridian; otherwise the caller scans all rows.
+    Non-finite coordinates have no cell and also fall back to the full scan.
+    """
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        return None
+
+    band = min(abs(math.radians(lat)) + radius_km / 6371.0, math.pi / 2.0)
+    if radius_km + 0.01 > _GRID_CELL_KM * math.cos(band) or abs(lon) + 2 * _GRID_DEG > 180.0:
+        return None
+
+    ci, cj = _grid_cell(lat, lon)
+    parts = [grid[cell]
+             for cell in ((ci + di, cj + dj) for di in (-1, 0, 1) for dj in (-1, 0, 1))
+             if cell in grid]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+
+def _index_pois_by_type(pois):
+    """
+    Build the per-type POI index.
+
+    Input
+    -----
+    pois
+        List of POI dictionaries
+
+    Returns
+    -------
+    Dictionary mapping lowercased type -> (POI list, lat, lon, cos(lat), grid)
+    where the coordinate arrays are float32 radians and grid is a _build_grid() map
+
+    Behavior
+    --------
+    Groups POIs by type once and lays each group out as parallel NumPy
+    arrays, so nearby_search() does a single dict lookup instead of
+    scanning and lowercasing every POI on each call.
+    """
+    grouped = {}
+    for poi in pois:
+        row = POI(name=poi["name"], lat=poi["lat"], lon=poi["lon"], type=poi["type"])
+        grouped.setdefault(row.type.lower(), []).append(row)
+
+    index = {}
+    for t, members in grouped.items():
+        index[t] = (members,
+                    *_coord_arrays([p.lat for p in members], [p.lon for p in members]),
+                    _build_grid(members))
+    return index
+
+
+# =====================================================================
+# Synthetic gazetteer + POI database (Lebanon-centric)
+# =====================================================================
+# The server exposes module-level tools for:
+#   - geocoding (name -> lat/lon),
+#   - reverse geocoding (lat/lon -> nearest known place),
+#   - nearby search (POIs within a radius by type).
+# Dataset is synthetic but geographically plausible for Lebanon.
+# NOTE: coordinates are approximate and simplified for assignment use.
+PLACES = {
+    # Keys are user-friendly names. Values carry lat/lon + metadata
+    "AUB": {"lat": 33.901, "lon": 35.480, "city": "Beirut", "type": "university"},
+    "Beirut": {"lat": 33.8938, "lon": 35.5018, "city": "Beirut", "type": "city"},
+    "Baalbek": {"lat": 34.006, "lon": 36.203, "city": "Baalbek", "type": "city"},
+    "Byblos": {"lat": 34.123, "lon": 35.651, "city": "Byblos", "type": "city"},
+    "Sidon": {"lat": 33.560, "lon": 35.375, "city": "Sidon", "type": "city"},
+    "Tyre": {"lat": 33.270, "lon": 35.196, "city": "Tyre", "type": "city"},
+    "Zahle": {"lat": 33.850, "lon": 35.900, "city": "Zahle", "type": "city"},
+    "Airport": {"lat": 33.8209, "lon": 35.4884, "city": "Beirut", "type": "airport"},
+    "RHUH": {"lat": 33.871, "lon": 35.513, "city": "Beirut", "type": "hospital"},  # Rafik Hariri Univ. Hospital (approx)
+}
+
+# Small POI list for nearby search (expanded; Lebanon-centric, approximate coords)
+# NOTE
+# ----
+# - Keep 'type' values consistent with nearby_search() filtering (e.g., 'hospital', 'mall', 'venue', 'university',
+#   'museum', 'park', 'airport', 'embassy', 'pharmacy', 'restaurant', 'hotel', 'stadium', 'theater', 'beach').
+# - Coordinates are approximate and simplified for assignment/demo use.
+POIS = [
+    # --- Hospitals ---
+    {"name": "AUBMC", "lat": 33.896, "lon": 35.478, "type": "hospital"},
+    {"name": "Rafik Hariri Univ. Hospital (RHUH)", "lat": 33.871, "lon": 35.513, "type": "hospital"},
+    {"name": "Hotel-Dieu de France", "lat": 33.8869, "lon": 35.5233, "type": "hospital"},
+    {"name": "LAU Medical Center – Rizk Hospital", "lat": 33.8927, "lon": 35.5159, "type": "hospital"},
+    {"name": "Baalbek Governmental Hospital", "lat": 34.010, "lon": 36.210, "type": "hospital"},
+    {"name": "Zahle Governmental Hospital", "lat": 33.846, "lon": 35.904, "type": "hospital"},
+
+    # --- Universities / Schools ---
+    {"name": "American University of Beirut (AUB)", "lat": 33.901, "lon": 35.480, "type": "university"},
+    {"name": "Lebanese American University (LAU) Beirut", "lat": 33.8957, "lon": 35.4865, "type": "university"},
+    {"name": "Saint Joseph University (USJ) – Huvelin", "lat": 33.8934, "lon": 35.5103, "type": "university"},
+
+    # --- Malls / Shopping ---
+    {"name": "Beirut Souks", "lat": 33.901, "lon": 35.504, "type": "mall"},
+    {"name": "ABC Achrafieh", "lat": 33.886, "lon": 35.521, "type": "mall"},
+    {"name": "ABC Verdun", "lat": 33.883, "lon": 35.486, "type": "mall"},
+    {"name": "City Centre Beirut", "lat": 33.868, "lon": 35.535, "type": "mall"},
+
+    # --- Museums / Culture ---
+    {"name": "National Museum of Beirut", "lat": 33.8833, "lon": 35.5192, "type": "museum"},
+    {"name": "Sursock Museum", "lat": 33.8920, "lon": 35.5171, "type": "museum"},
+    {"name": "Byblos Archaeological Site", "lat": 34.1239, "lon": 35.6518, "type": "museum"},
+    {"name": "Baalbek Roman Temples", "lat": 34.0060, "lon": 36.2030, "type": "museum"},
+
+    # --- Landmarks / Venues / Theaters ---
+    {"name": "Forum de Beyrouth", "lat": 33.898, "lon": 35.535, "type": "venue"},
+    {"name": "Beiteddine Palace (Chouf)", "lat": 33.694, "lon": 35.579, "type": "museum"},
+    {"name": "Roman Hippodrome of Tyre", "lat": 33.263, "lon": 35.205, "type": "museum"},
+    {"name": "Byblos Old Souk", "lat": 34.121, "lon": 35.648, "type": "venue"},
+    {"name": "Al Madina Theatre", "lat": 33.8937, "lon": 35.4867, "type": "theater"},
+
+    # --- Parks / Beaches ---
+    {"name": "Horsh Beirut", "lat": 33.8727, "lon": 35.5053, "type": "park"},
+    {"name": "Rouche (Pigeon Rocks)", "lat": 33.8896, "lon": 35.4703, "type": "park"},
+    {"name": "Tyre Beach (South)", "lat": 33.257, "lon": 35.214, "type": "beach"},
+    {"name": "Ramlet el-Baida Beach", "lat": 33.8749, "lon": 35.4769, "type": "beach"},
+
+    # --- Transport ---
+    {"name": "Beirut–Rafic Hariri International Airport", "lat": 33.8209, "lon": 35.4884, "type": "airport"},
+    {"name": "Charles Helou Bus Station", "lat": 33.8994, "lon": 35.5199, "type": "venue"},
+
+    # --- Hotels / Restaurants / Cafés ---
+    {"name": "Phoenicia Hotel Beirut", "lat": 33.9015, "lon": 35.4900, "type": "hotel"},
+    {"name": "Le Gray (Downtown)", "lat": 33.8967, "lon": 35.5019, "type": "hotel"},
+    {"name": "Tawlet Mar Mikhael", "lat": 33.8968, "lon": 35.5182, "type": "restaurant"},
+    {"name": "Mayrig Gemmayze", "lat": 33.8944, "lon": 35.5148, "type": "restaurant"},
+    {"name": "Zahle Wine House", "lat": 33.8465, "lon": 35.9035, "type": "restaurant"},
+
+    # --- Pharmacies / Embassies / Other utilities ---
+    {"name": "Pharmacy 24/7 Hamra", "lat": 33.8955, "lon": 35.4820, "type": "pharmacy"},
+    {"name": "US Embassy (Awkar - approx)", "lat": 33.956, "lon": 35.589, "type": "embassy"},
+    {"name": "French Embassy (Achrafieh - approx)", "lat": 33.888, "lon": 35.517, "type": "embassy"},
+
+    # --- Sports / Stadiums ---
+    {"name": "Camille Chamoun Sports City Stadium", "lat": 33.859, "lon": 35.494, "type": "stadium"},
+]
+
+
+# =====================================================================
+# Precomputed indexes over the static dataset
+# =====================================================================
+# NOTE
+# ----
+# PLACES and POIS are static, so the place-side trig of the Haversine formula
+# and the lowercase lookup tables are computed once here; the tools below only
+# evaluate per-query terms.
+_PLACE_NAMES = list(PLACES)         # row order of the arrays below
+_PLACE_LAT, _PLACE_LON, _PLACE_COSLAT = _coord_arrays(
+    [info["lat"] for info in PLACES.values()],
+    [info["lon"] for info in PLACES.values()],
+)                                   # φ, λ (radians), cos φ as float32
+
+# Lowercased lookup tables (used by geocode): exact-key dict and an
+# ordered (name, info, name_lower, city_lower) tuple for substring scans
+_PLACES_LOWER = {name.lower(): (name, info) for name, info in PLACES.items()}
+_PLACES_SCAN = tuple((name, info, name.lower(), info["city"].lower())
+                     for name, info in PLACES.items())
+
+# Per-type POI index: lowercased type -> (POI rows, lat, lon, cos(lat), grid)
+_POI_BY_TYPE = _index_pois_by_type(POIS)
+
+
+# =====================================================================
+# Internal helpers
+# =====================================================================
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_place(q: str):
+    """
+    Resolve a normalized query against the gazetteer.
+
+    Input
+    -----
+    q
+        Stripped, lowercased place query
+
+    Returns
+    -------
+    (name, info) tuple for the first matching place, or None
+
+    Behavior
+    --------
+    Tries an O(1) exact-key hit first, then scans the precomputed
+    lowercase key/city strings in gazetteer order. Memoized, since the
+    gazetteer is immutable.
+    """
+    hit = _PLACES_LOWER.get(q)   # exact key match (fast path)
+    if hit is not None:
+        return hit
+
+    # fallback: substring scan in key or city field
+    for name, info, name_lower, city_lower in _PLACES_SCAN:
+        if q in name_lower or q in city_lower:
+            return name, info
+
+    return None  # no match
+
+
+@functools.lru_cache(maxsize=1024)
+def _nearest_place(lat_q: float, lon_q: float):
+    """
+    Find the closest gazetteer entry to a (rounded) coordinate.
+
+    Input
+    -----
+    lat_q, lon_q
+        Query coordinate, rounded by the caller so repeats share a cache key
+
+    Returns
+    -------
+    Tuple of _PLACE_NAMES indices (in gazetteer order) that can be the
+    nearest place to any coordinate within the rounding of the key
+
+    Behavior
+    --------
+    Runs the compiled float32 Haversine kernel over the precomputed
+    gazetteer arrays and keeps every place within a small slack of the
+    minimum; the caller picks the exact nearest among them. Memoized,
+    since the gazetteer is immutable.
+    """
+    # Query-side trig is computed once; place-side trig is precomputed
+    phi = math.radians(lat_q)
+    lam = math.radians(lon_q)
+    d = np.empty(_PLACE_LAT.shape[0])          # distances to all places [km]
+    _hav_many(phi, lam, math.cos(phi), _PLACE_LAT, _PLACE_LON, _PLACE_COSLAT, d)
+
+    # Slack covers the key rounding (< 8 m each way) plus float32 rounding
+    return tuple(np.nonzero(d <= d.min() + 0.02 + _F32_SLACK_KM)[0].tolist())
+
+
+def _geocode_result(query: str) -> dict:
+    """
+    Build the geocode response for one query.
+
+    Input
+    -----
+    query
+        Raw place query
+
+    Returns
+    -------
+    Match dictionary, or an error dictionary when nothing matches
+
+    Behavior
+    --------
+    Normalizes the query and resolves it through _lookup_place(); shared
+    by geocode() and geocode_many().
+    """
+    hit = _lookup_place(query.strip().lower())  # normalize user input
+    if hit is not None:
+        name, info = hit
+        # flat payload: 'meta' used to repeat lat/lon and cost extra tokens
+        return {"name": name, "lat": info["lat"], "lon": info["lon"],
+                "type": info["type"], "city": info["city"]}
+
+    # no match
+    return {"error": f"No match found for '{query}'"}
+
+
+# =====================================================================
+# Tools (top-level) — clean JSON schemas for the Agents SDK
+# =====================================================================
+
+@tool
+def geocode(query: str) -> dict:
+    """
+    Convert a place name to coordinates.
+
+    Input
+    -----
+    query
+        Place name to resolve (case-insensitive). Examples: "AUB", "Beirut", "Baalbek"
+
+    Returns
+    -------
+    Dictionary containing 'name', 'lat', 'lon', 'type' and 'city' for the first matching place
+
+    Behavior
+    --------
+    Performs a simple case-insensitive key or substring match against the internal gazetteer.
+    If multiple places match, returns the best (first) match with basic metadata.
+    Lookups go through precomputed lowercase indexes and are memoized.
+    """
+    return _geocode_result(query)
+
+
+@tool
+def geocode_many(queries: list[str]) -> dict:
+    """
+    Convert several place names to coordinates in one call.
+
+    Input
+    -----
+    queries
+        Place names to resolve (case-insensitive). Example: ["AUB", "Byblos"]
+
+    Returns
+    -------
+    Dictionary containing 'results', one geocode() result per query (in order)
+
+    Behavior
+    --------
+    Applies the same lookup as geocode() to every query, so a multi-place
+    prompt needs a single tool round trip instead of one per place.
+    """
+    return {"results": [_geocode_result(q) for q in queries]}
+
+
+@tool
+def reverse_geocode(lat: float, lon: float) -> dict:
+    """
+    Convert coordinates to the nearest known place.
+
+    Input
+    -----
+    lat
+        Latitude
+    lon
+        Longitude
+
+    Returns
+    -------
+    Dictionary containing nearest_location (name, city, distance_km)
+
+    Behavior
+    --------
+    Computes Haversine distance to all known places in one compiled pass
+    over the precomputed gazetteer arrays and returns the closest one.
+    The float32 shortlist is memoized per coordinate rounded to
+    4 decimals (~11 m); the nearest place and its reported distance are
+    then resolved in float64 for the exact query.
+    """
+    if not _PLACE_NAMES:
+        # Defensive: in case PLACES is empty
+        return {"error": "No places available."}
+
+    # Round to 4 decimals (~11 m) so nearby repeat queries hit the cache
+    cands = _nearest_place(round(float(lat), 4), round(float(lon), 4))
+
+    # Exact float64 distances for the shortlist; first strict minimum wins
+    name, best_d = None, math.inf
+    for i in cands:
+        info = PLACES[_PLACE_NAMES[i]]
+        d = _haversine_km(lat, lon, info["lat"], info["lon"])
+        if d < best_d:
+            name, best_d = _PLACE_NAMES[i], d
+
+    if name is None:
+        # No finite distance (e.g. NaN coordinates): nothing is nearest
+        return {"error": "No places available."}
+    info = PLACES[name]
+
+    return {
+        "nearest_location": {
+            "name": name,
+            "city": info["city"],
+            "type": info["type"],
+            "distance_km": round(best_d, 3),
+            "lat": info["lat"],
+            "lon": info["lon"],
         }
+    }
 
-    @tool
-    def nearby_search(lat: float, lon: float, poi_type: str, radius_km: float = 5.0, limit: int = 10) -> dict:
-        """
-        Find nearby points-of-interest of a given type.
 
-        Input
-        -----
-        lat
-            Latitude
-        lon
-            Longitude
-        poi_type
-            POI type filter (e.g., 'hospital', 'mall', 'venue', 'airport')
-        radius_km
-            Search radius in kilometers
-        limit
-            Maximum number of returned results
+@tool
+def nearby_search(lat: float, lon: float, poi_type: str, radius_km: float = 5.0, limit: int = 10) -> dict:
+    """
+    Find nearby points-of-interest of a given type.
 
-        Returns
-        -------
-        Dictionary containing filtered POIs sorted by ascending distance
+    Input
+    -----
+    lat
+        Latitude
+    lon
+        Longitude
+    poi_type
+        POI type filter (e.g., 'hospital', 'mall', 'venue', 'airport')
+    radius_km
+        Search radius in kilometers
+    limit
+        Maximum number of returned results
 
-        Behavior
-        --------
-        Filters the in-memory POI list by type and distance to (lat, lon), then sorts by proximity.
-        """
-        t = poi_type.strip().lower()   # normalize type for comparison
-        hits = []                      # accumulator for matching POIs
+    Returns
+    -------
+    Dictionary containing filtered POIs sorted by ascending distance
 
-        for poi in GeolocationServer.POIS:
-            if poi["type"].lower() != t:
-                continue               # skip POIs of other types
-            d = GeolocationServer._haversine_km(lat, lon, poi["lat"], poi["lon"])
+    Behavior
+    --------
+    Fetches the POIs of the requested type from the per-type index, narrows
+    them to the query's grid neighbourhood (small radii), discards far-away
+    POIs with a planar prefilter, computes float32 Haversine distances to
+    (lat, lon) for the rest, re-measures the survivors in float64, filters
+    by radius, then selects the `limit` closest with a partial sort.
+    """
+    t = poi_type.strip().lower()   # normalize type for comparison
+    hits = []                      # accumulator for matching POIs
+
+    bucket = _POI_BY_TYPE.get(t)
+    if bucket is not None:
+        pois, lats, lons, coslats, grid = bucket
+        phi = math.radians(lat)    # query-side terms computed once
+        lam = math.radians(lon)
+
+        # Restrict to the grid neighbourhood of the query when possible
+        rows = _grid_rows(grid, lat, lon, radius_km)
+        if rows is not None:
+            lats, lons, coslats = lats[rows], lons[rows], coslats[rows]
+
+        # Cheap equirectangular prefilter (no trig per POI). Using the smallest
+        # cos(lat) reachable within the radius makes the planar distance a lower
+        # bound of the great-circle one, so no true hit is ever rejected.
+        # The query is cast to float32 so the scan stays in float32, and the
+        # radius gets ~6 m of slack to absorb float32 rounding.
+        band = min(abs(phi) + radius_km / 6371.0, math.pi / 2.0)
+        dx = np.abs(lons - np.float32(lam))
+        dx = np.minimum(dx, np.float32(2.0 * math.pi) - dx) * np.float32(math.cos(band))
+        dy = lats - np.float32(phi)
+        r = radius_km / 6371.0 + 1e-6
+        cand = np.nonzero(dx * dx + dy * dy <= np.float32(r * r))[0]
+
+        # float32 Haversine for the prefilter survivors, with slack
+        dists = np.empty(cand.size)
+        _hav_many(phi, lam, math.cos(phi), lats[cand], lons[cand], coslats[cand], dists)
+        cand = cand[dists <= radius_km + _F32_SLACK_KM]
+        if rows is not None:
+            cand = rows[cand]      # back to indices into `pois`
+
+        # Final radius test and reported distances in float64 from the
+        # source coordinates (only the few survivors reach this loop)
+        idx, dm = [], []
+        for i in cand.tolist():
+            poi = pois[i]
+            d = _haversine_km(lat, lon, poi.lat, poi.lon)
             if d <= radius_km:
-                entry = dict(poi)      # shallow copy to avoid mutation
-                entry["distance_km"] = round(d, 3)
-                hits.append(entry)
-
-        # sort by distance, closest first
-        hits.sort(key=lambda x: x["distance_km"])
-        if limit is not None:
-            hits = hits[:limit]        # cap results if a limit is provided
-
-        return {
-            "query": {"lat": lat, "lon": lon, "type": poi_type, "radius_km": radius_km},
-            "results": hits,
-        }
+                idx.append(i)
+                dm.append(round(d, 3))
+        idx = np.array(idx, dtype=np.intp)
+        dm = np.array(dm)          # rounded distances [km]
+
+        # Order by reported distance, ties in dataset order
+        if limit is not None and 0 <= limit < dm.size:
+            # partial selection of the `limit` closest (plus boundary ties),
+            # then sort only those
+            kth = np.partition(dm, limit - 1)[limit - 1] if limit else -np.inf
+            sel = np.nonzero(dm <= kth)[0]
+            sel = sel[np.lexsort((idx[sel], dm[sel]))][:limit]
+        else:
+            # sort by distance, closest first
+            sel = np.lexsort((idx, dm))
+            if limit is not None:
+                sel = sel[:limit]  # cap results if a limit is provided
+
+        # build result dicts only for the returned POIs
+        for k in sel:
+            poi = pois[idx[k]]
+            hits.append({
+                "name": poi.name,
+                "lat": poi.lat,
+                "lon": poi.lon,
+                "type": poi.type,
+                "distance_km": float(dm[k]),
+            })
+
+    return {
+        "query": {"lat": lat, "lon": lon, "type": poi_type, "radius_km": radius_km},
+        "results": hits,
+    }
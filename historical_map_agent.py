@@ -6,6 +6,13 @@ from historical_map_server.server import (
 )
 import asyncio
 
+try:
+    # Faster libuv-based event loop when available (not supported on Windows)
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 def build_historical_agent(model="gpt-4o-mini"):
     """
@@ -47,13 +54,14 @@ def build_historical_agent(model="gpt-4o-mini"):
     return agent
 
 
-def interactive_demo():
+def interactive_demo(parallel=False):
     """
     Run an interactive demonstration.
 
     Input
     -----
-    None
+    parallel
+        If True, send the example prompts concurrently instead of in sequence
 
     Returns
     -------
@@ -64,6 +72,7 @@ def interactive_demo():
     Creates an agent, starts a Runner session, and demonstrates the
     usage of each tool by sending example prompts. Results are
     printed directly for verification and assignment requirements.
+    All prompts run inside a single event loop.
     """
     # Build agent
     agent = build_historical_agent()
@@ -78,11 +87,23 @@ def interactive_demo():
         print("ASSISTANT:", response)
 
     # Demonstration queries
-    asyncio.run(ask("Show historical events near Beirut at 33.89, 35.50."))
-    asyncio.run(ask("Give me a timeline for Baalbek sorted by year."))
-    asyncio.run(ask("I am traveling from Beirut to Baalbek. Summarize the history along my route."))
+    prompts = [
+        "Show historical events near Beirut at 33.89, 35.50.",
+        "Give me a timeline for Baalbek sorted by year.",
+        "I am traveling from Beirut to Baalbek. Summarize the history along my route.",
+    ]
+
+    async def main():
+        if parallel:
+            # Prompts are independent and I/O-bound, so they can overlap
+            await asyncio.gather(*(ask(p) for p in prompts))
+        else:
+            for p in prompts:
+                await ask(p)
+
+    asyncio.run(main())
 
 
 # Run demo when invoked as a script
 if __name__ == "__main__":
-interactive_demo()
+    interactive_demo()
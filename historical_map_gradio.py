@@ -1,14 +1,22 @@
 # historical_map_gradio.py
 
 import gradio as gr
-import asyncio
+import functools
 from agents import Agent, Runner
+from openai.types.responses import ResponseTextDeltaEvent
 from historical_map_server.server import (
     events_near_location,
     region_timeline,
     route_history_summary,
 )
 
+try:
+    # Faster libuv-based event loop when available (not supported on Windows)
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # =====================================================================
 # Build agent for the UI
 # =====================================================================
@@ -37,49 +45,66 @@ def build_historical_agent():
         model="gpt-4o-mini",
     )
 
-agent = build_historical_agent()
-runner = Runner()
-
 
-async def run_agent_async(message: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _agent() -> Agent:
     """
-    Async wrapper around Runner.run.
-
-    Input
-    -----
-    message
-        User input prompt
+    Process-wide Agent accessor.
 
     Returns
     -------
-    Final LLM output text
+    Agent
+        The UI agent, built on first use and reused afterwards
 
     Behavior
     --------
-    Awaits model response and returns the final string output.
+    Memoizes build_historical_agent() so the Agent and its tool
+    schemas are built once per process, lazily on the first request.
+    """
+    return build_historical_agent()
+
+
+@functools.lru_cache(maxsize=1)
+def _runner() -> Runner:
+    """
+    Process-wide Runner accessor.
+
+    Returns
+    -------
+    Runner
+        Shared Runner instance, created lazily on first use
     """
-    result = await runner.run(agent, message)
-    return result.final_output  # correct attribute for the Agents SDK
+    return Runner()
 
 
-def run_agent(message: str) -> str:
+async def run_agent(message: str):
     """
-    Sync entrypoint for Gradio.
+    Streaming entrypoint for Gradio.
 
     Input
     -----
     message
         User input prompt
 
-    Returns
-    -------
-    Final LLM output text
+    Yields
+    ------
+    str
+        Answer text accumulated so far
 
     Behavior
     --------
-    Bridges Gradio's sync call with the async runner using asyncio.run.
+    Runs the agent in streaming mode and yields the growing answer on
+    every text delta, so the UI shows first tokens as soon as they arrive
+    instead of after the whole generation. The last value yielded is the
+    Agent's final output (after any tool calls).
     """
-    return asyncio.run(run_agent_async(message))
+    result = _runner().run_streamed(_agent(), message)
+    text = ""
+    async for event in result.stream_events():
+        if event.type == "raw_response_event" and isinstance(event.data, ResponseTextDeltaEvent):
+            text += event.data.delta
+            yield text
+    yield result.final_output  # Agents SDK: final text output
 
 
 # =====================================================================
@@ -93,6 +118,7 @@ ui = gr.Interface(
     title="Historical Timeline Agent",
     description="Ask about Beirut, Baalbek, or routes.",
     allow_flagging="never",
+    api_name="ask",
 )
 
 if __name__ == "__main__":
@@ -1,8 +1,12 @@
 # historical_map_server/server.py
 
 from dataclasses import dataclass, asdict
+import functools
 from agents.tool import function_tool as tool
-import math
+from operator import itemgetter
+from math import sin, cos, radians, pi, isfinite
+import numpy as np
+from scipy.spatial import cKDTree
 
 # =====================================================================
 # Server configuration (MCP startup parameters)
@@ -46,6 +50,42 @@ DEFAULT_SERVER_PARAMS = ServerParams(
 )
 
 
+# =====================================================================
+# Index builders
+# =====================================================================
+
+# C-implemented sort key (no per-call lambda frame)
+_YEAR_KEY = itemgetter("year")
+
+
+def _build_region_index(events):
+    """
+    Build the region lookup index.
+
+    Input
+    -----
+    events
+        List of event objects
+
+    Returns
+    -------
+    Dictionary mapping each lowercase region name -> list of event indices
+
+    Behavior
+    --------
+    Each list holds every event whose region contains that name (the
+    same substring rule region_timeline() applies), pre-sorted by year
+    with ties kept in dataset order.
+    """
+    names = {ev["region"].lower() for ev in events}
+    years = list(map(_YEAR_KEY, events))
+    by_year = sorted(range(len(events)), key=years.__getitem__)
+    return {
+        name: [i for i in by_year if name in events[i]["region"].lower()]
+        for name in names
+    }
+
+
 # =====================================================================
 # Historical Timeline Server
 # =====================================================================
@@ -160,6 +200,35 @@ class HistoricalTimelineServer:
          "description": "Nationwide demonstrations reshaped Lebanon’s modern political landscape."},
     ]
 
+    # Keep the dataset in chronological order (stable, so same-year events
+    # keep their listed order); year windows then become contiguous slices.
+    # _SRC_POS[i] is the listed position of sorted event i, used to break
+    # distance ties in listing order.
+    _SRC_POS = np.argsort([ev["year"] for ev in EVENTS], kind="stable")
+    EVENTS.sort(key=_YEAR_KEY)
+
+    # =================================================================
+    # Structure-of-Arrays view of EVENTS (built once at class load)
+    # =================================================================
+    _LAT = np.array([ev["lat"] for ev in EVENTS], dtype=np.float64)
+    _LON = np.array([ev["lon"] for ev in EVENTS], dtype=np.float64)
+    _YEAR = np.array([ev["year"] for ev in EVENTS], dtype=np.int32)
+    _REGION = np.array([ev["region"] for ev in EVENTS], dtype=object)
+    _REGION_LOWER = np.array([ev["region"].lower() for ev in EVENTS], dtype=object)
+    _LAT_RAD = np.radians(_LAT)
+    _LON_RAD = np.radians(_LON)
+    _COS_LAT = np.cos(_LAT_RAD)
+
+    # Spatial index: events as 3D points on the unit sphere, so a great-circle
+    # radius maps to a Euclidean chord radius (no geodesic-aware index needed)
+    _XYZ = np.column_stack((_COS_LAT * np.cos(_LON_RAD),
+                            _COS_LAT * np.sin(_LON_RAD),
+                            np.sin(_LAT_RAD)))
+    _TREE = cKDTree(_XYZ)
+
+    # Lowercase region name -> year-sorted event indices
+    _REGION_INDEX = _build_region_index(EVENTS)
+
     # =================================================================
     # Constructor
     # =================================================================
@@ -179,43 +248,118 @@ class HistoricalTimelineServer:
     # =================================================================
 
     @staticmethod
-    def _distance_km(lat1, lon1, lat2, lon2):
+    def _a_from(lat1_rad, lat2_rad, cos_lat1, cos_lat2, dlon):
+        """
+        Compute the Haversine "a" term.
+
+        Input
+        -----
+        lat1_rad, lat2_rad
+            Latitudes in radians (scalars or arrays)
+        cos_lat1, cos_lat2
+            Cosines of those latitudes
+        dlon
+            Longitude difference in radians
+
+        Returns
+        -------
+        a = sin²(Δφ/2) + cos φ1 cos φ2 sin²(Δλ/2)
+
+        Behavior
+        --------
+        Uses sin²(x/2) = (1 - cos x) / 2 so both terms share one cos
+        kernel. "a" is monotonic in distance, so it can be compared and
+        ranked directly; see _km_from_a() and _a_threshold().
+        """
+        return (0.5 * (1 - np.cos(lat2_rad - lat1_rad))
+                + cos_lat1 * cos_lat2 * 0.5 * (1 - np.cos(dlon)))
+
+    @staticmethod
+    def _km_from_a(a):
+        """
+        Convert Haversine "a" values to kilometers.
+        """
+        return 2 * 6371 * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    @staticmethod
+    def _a_threshold(radius_km):
+        """
+        Convert a distance threshold to "a" space.
+
+        Input
+        -----
+        radius_km
+            Distance threshold in kilometers
+
+        Returns
+        -------
+        Threshold such that a <= threshold  <=>  distance <= radius_km
+        """
+        if radius_km < 0:
+            return -1.0                     # nothing can be closer than a negative radius
+        return sin(min(radius_km / 6371, pi) / 2) ** 2
+
+    @staticmethod
+    def _a_from_query(qlat_rad, cos_qlat, qlon_rad, idx=None):
+        """
+        Compute Haversine "a" from one coordinate to many events.
+
+        Input
+        -----
+        qlat_rad, cos_qlat, qlon_rad
+            Query coordinate (radians) and cosine of its latitude
+        idx
+            Optional event indices; all events when omitted
+
+        Returns
+        -------
+        Array of "a" values, aligned with EVENTS (or idx)
+
+        Behavior
+        --------
+        Vectorized over the precomputed event arrays. The query terms
+        are reduced once by the caller, so they are shared with the
+        spatial-index lookup instead of being recomputed here.
+        """
+        hts = HistoricalTimelineServer
+        lat_rad, lon_rad, cos_lat = hts._LAT_RAD, hts._LON_RAD, hts._COS_LAT
+        if idx is not None:
+            lat_rad, lon_rad, cos_lat = lat_rad[idx], lon_rad[idx], cos_lat[idx]
+
+        return hts._a_from(qlat_rad, lat_rad, cos_qlat, cos_lat, lon_rad - qlon_rad)
+
+    @staticmethod
+    def _year_bounds(start_year, end_year):
         """
-        Compute spherical distance using the Haversine formula.
+        Locate a year window in the chronologically sorted dataset.
 
         Input
         -----
-        lat1, lon1
-            First coordinate
-        lat2, lon2
-            Second coordinate
+        start_year
+            Minimum year
+        end_year
+            Maximum year
 
         Returns
         -------
-        Distance in kilometers
+        (lo, hi) index range of EVENTS inside the window
 
         Behavior
         --------
-        Used to evaluate spatial proximity.
+        Binary search over the sorted _YEAR array.
         """
-        r = 6371
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = (math.sin(dlat / 2) ** 2
-             + math.cos(math.radians(lat1))
-             * math.cos(math.radians(lat2))
-             * math.sin(dlon / 2) ** 2)
-        return 2 * r * math.asin(math.sqrt(a))
+        years = HistoricalTimelineServer._YEAR
+        lo = int(np.searchsorted(years, start_year, "left")) if start_year is not None else 0
+        hi = int(np.searchsorted(years, end_year, "right")) if end_year is not None else len(years)
+        return lo, hi
 
     @staticmethod
-    def _filter_years(events, start_year, end_year):
+    def _year_mask(start_year, end_year):
         """
-        Filter dataset by year range.
+        Boolean year-window mask over EVENTS.
 
         Input
         -----
-        events
-            List of event objects
         start_year
             Minimum year
         end_year
@@ -223,27 +367,254 @@ class HistoricalTimelineServer:
 
         Returns
         -------
-        Filtered list
+        Boolean array aligned with EVENTS
 
         Behavior
         --------
-        Excludes events outside the given year window.
+        Compares against the _YEAR column, so callers can AND it with
+        distance or region masks before extracting indices once.
         """
-        out = []
-        for ev in events:
-            y = ev["year"]
-            if start_year is not None and y < start_year:
-                continue
-            if end_year is not None and y > end_year:
-                continue
-            out.append(ev)
-        return out
+        years = HistoricalTimelineServer._YEAR
+        mask = np.ones(len(years), dtype=bool)
+        if start_year is not None:
+            mask &= years >= start_year
+        if end_year is not None:
+            mask &= years <= end_year
+        return mask
+
+    @staticmethod
+    def _filter_years(idx, start_year, end_year):
+        """
+        Filter event indices by year range.
+
+        Input
+        -----
+        idx
+            Sorted integer array of EVENTS indices
+        start_year
+            Minimum year
+        end_year
+            Maximum year
+
+        Returns
+        -------
+        Integer index array of the events inside the window
+
+        Behavior
+        --------
+        EVENTS is year-sorted, so the window is the index range from
+        _year_bounds(); the sorted indices are cut to it with two
+        np.searchsorted calls instead of scanning every event.
+        """
+        lo, hi = HistoricalTimelineServer._year_bounds(start_year, end_year)
+        return idx[np.searchsorted(idx, lo):np.searchsorted(idx, hi)]
+
+
+# =====================================================================
+# Narrative templates
+# =====================================================================
+
+_ERAS_PHRASE = (
+    "covering Phoenician, Hellenistic, Roman, Byzantine, Islamic, "
+    "Mamluk, Ottoman, and modern Lebanese periods."
+)
+_ROUTE_SUMMARY = (
+    "This route intersects historically significant regions including "
+    "%s. Events span from %s to %s, " + _ERAS_PHRASE
+)
+_NO_EVENTS_SUMMARY = "No historical events fall within the specified corridor."
+
+
+@functools.lru_cache(maxsize=256)
+def _regions_phrase(regions):
+    """Sorted, comma-joined region names (routes tend to repeat region sets)."""
+    return ", ".join(sorted(regions))
 
 
 # =====================================================================
 # Tools (top-level) — clean JSON schemas for the Agents SDK
 # =====================================================================
 
+def _frozen(arr):
+    """Mark an array read-only so it can be shared (e.g. from a cache)."""
+    arr.setflags(write=False)
+    return arr
+
+
+def _route_impl(path_rad, corridor_km):
+    """
+    Measure a route and find events within its corridor (core of
+    route_history_summary).
+
+    Input
+    -----
+    path_rad
+        (P, 2) array of [lat, lon] waypoints in radians
+    corridor_km
+        Maximum offset distance
+
+    Returns
+    -------
+    (length_km, indices, distances): route length, EVENTS indices in
+    year order, and their distances to the route in kilometers
+
+    Behavior
+    --------
+    Distances are measured to the route's great-circle segments, not
+    just its waypoints. Each segment lies inside a spherical cap around
+    its midpoint of radius half its length, so the KD-tree returns the
+    candidate (segment, event) pairs from that cap widened by the
+    corridor. Each pair then takes the cross-track distance when the
+    event projects onto the segment, and the nearer endpoint otherwise;
+    the per-event minimum and the corridor test stay in "a" space.
+    """
+    hts = HistoricalTimelineServer
+    r = 6371
+    plat, plon = path_rad[:, 0], path_rad[:, 1]
+    pcos, psin = np.cos(plat), np.sin(plat)
+    seg_dlon = np.diff(plon)
+
+    # Route length (consecutive waypoints)
+    seg_a = hts._a_from(plat[:-1], plat[1:], pcos[:-1], pcos[1:], seg_dlon)
+    seg_ang = 2 * np.arcsin(np.sqrt(np.clip(seg_a, 0.0, 1.0)))
+    length_km = float(r * seg_ang.sum())
+
+    empty = np.empty(0, dtype=np.intp), np.empty(0)
+    if corridor_km < 0:
+        return length_km, *empty
+
+    # Segment endpoints as waypoint indices. A non-finite waypoint is
+    # skipped: its neighbours' segments collapse onto the finite end, so
+    # that end still counts as a point of the route.
+    ia = np.arange(len(plat) - 1)
+    ib = ia + 1
+    fin = np.isfinite(plat) & np.isfinite(plon)
+    fa, fb = fin[ia], fin[ib]
+    ia, ib = np.where(fa, ia, ib), np.where(fb, ib, ia)
+    ia, ib = ia[fa | fb], ib[fa | fb]
+    if not ia.size:
+        return length_km, *empty
+    dlon_ab = plon[ib] - plon[ia]
+    ang_ab = 2 * np.arcsin(np.sqrt(np.clip(
+        hts._a_from(plat[ia], plat[ib], pcos[ia], pcos[ib], dlon_ab), 0.0, 1.0)))
+
+    # Prefilter: bounding cap of each segment, widened by the corridor
+    xyz = np.column_stack((pcos * np.cos(plon), pcos * np.sin(plon), psin))
+    mid = xyz[ia] + xyz[ib]
+    norm = np.linalg.norm(mid, axis=1)
+    degenerate = norm < 1e-12                  # antipodal endpoints
+    mid[degenerate] = xyz[ia][degenerate]
+    mid[~degenerate] /= norm[~degenerate, None]
+    cap = np.minimum(ang_ab / 2 + corridor_km / r, np.pi)
+    cap[degenerate] = np.pi
+    cands = hts._TREE.query_ball_point(mid, r=2 * np.sin(cap / 2) + 1e-9)
+
+    counts = np.fromiter((len(c) for c in cands), dtype=np.intp, count=len(cands))
+    if not counts.sum():
+        return length_km, *empty
+    s = np.repeat(np.arange(len(cands)), counts)
+    e = np.concatenate([np.asarray(c, dtype=np.intp) for c in cands])
+    sa, sb = ia[s], ib[s]
+
+    # Endpoint distances for each (segment, event) pair
+    elat, elon, ecos = hts._LAT_RAD[e], hts._LON_RAD[e], hts._COS_LAT[e]
+    dlon_ae = elon - plon[sa]
+    a_ae = hts._a_from(plat[sa], elat, pcos[sa], ecos, dlon_ae)
+    a_be = hts._a_from(plat[sb], elat, pcos[sb], ecos, elon - plon[sb])
+    d13 = 2 * np.arcsin(np.sqrt(np.clip(a_ae, 0.0, 1.0)))
+
+    # Cross-track / along-track geometry from the initial bearings
+    b12 = np.arctan2(np.sin(dlon_ab) * pcos[ib],
+                     pcos[ia] * psin[ib] - psin[ia] * pcos[ib] * np.cos(dlon_ab))[s]
+    b13 = np.arctan2(np.sin(dlon_ae) * ecos,
+                     pcos[sa] * np.sin(elat) - psin[sa] * ecos * np.cos(dlon_ae))
+    dxt = np.arcsin(np.clip(np.sin(d13) * np.sin(b13 - b12), -1.0, 1.0))
+    dat = np.arccos(np.clip(np.cos(d13) / np.cos(dxt), -1.0, 1.0))
+    inside = (np.cos(b13 - b12) > 0) & (dat <= ang_ab[s])
+
+    # Pair distance in "a" space: sin²(dxt/2) when the event projects onto
+    # the segment, otherwise the nearer endpoint (no asin/sqrt needed)
+    a_pair = np.where(inside, np.sin(dxt / 2) ** 2, np.minimum(a_ae, a_be))
+
+    # Closest segment per event ("a" is monotonic in distance); kilometers
+    # only for the accepted events
+    best = np.full(len(hts._LAT), np.inf)
+    np.minimum.at(best, e, a_pair)
+    idx = np.nonzero(best <= hts._a_threshold(corridor_km))[0]
+    return length_km, idx, hts._km_from_a(best[idx])
+
+
+@functools.lru_cache(maxsize=1024)
+def _events_near_location_impl(lat, lon, radius_km, start_year, end_year, limit=None):
+    """
+    Find events inside a search radius (memoized core of events_near_location).
+
+    Input
+    -----
+    lat, lon
+        Query coordinate
+    radius_km
+        Search radius in kilometers
+    start_year, end_year
+        Year filters (None for open-ended)
+    limit
+        Max number of events (None for all)
+
+    Returns
+    -------
+    (indices, distances): read-only arrays of EVENTS indices ordered by
+    distance, and their distances in kilometers
+
+    Behavior
+    --------
+    Queries the KD-tree spatial index for candidate events and computes
+    exact distances for those only. Results are frozen (read-only) so
+    cached entries can be shared across calls.
+    """
+    if not (isfinite(lat) and isfinite(lon)):
+        # No distance to a non-finite coordinate is inside any radius
+        return _frozen(np.empty(0, dtype=np.intp)), _frozen(np.empty(0))
+
+    # Query-side terms, reduced once for the index lookup and the exact test
+    qlat_rad, qlon_rad = radians(lat), radians(lon)
+    cos_qlat = cos(qlat_rad)
+
+    # Candidate events from the spatial index: a great-circle radius of
+    # radius_km is a chord of 2*sin(theta/2) on the unit sphere
+    theta = min(max(radius_km, 0.0) / 6371, pi)
+    xyz_q = (cos_qlat * cos(qlon_rad), cos_qlat * sin(qlon_rad), sin(qlat_rad))
+    idx = np.sort(np.asarray(
+        HistoricalTimelineServer._TREE.query_ball_point(xyz_q, r=2 * sin(theta / 2) + 1e-9),
+        dtype=np.intp,
+    ))
+
+    # Exact test for the candidates, in "a" space (no asin/sqrt per event),
+    # combined with the year filter into a single mask
+    a = HistoricalTimelineServer._a_from_query(qlat_rad, cos_qlat, qlon_rad, idx)
+    mask = HistoricalTimelineServer._year_mask(start_year, end_year)[idx]
+    mask &= a <= HistoricalTimelineServer._a_threshold(radius_km)
+
+    # Sort by nearest event: by the reported (rounded) distance, ties in
+    # listing order
+    keep = np.nonzero(mask)[0]
+    idx, a = idx[keep], a[keep]
+    d = HistoricalTimelineServer._km_from_a(a)    # kilometers for survivors only
+    rd = np.round(d, 3)
+    src = HistoricalTimelineServer._SRC_POS[idx]
+    if limit is not None and 0 <= limit < a.size:
+        # partial selection of the `limit` closest (plus boundary ties),
+        # then sort only those
+        kth = np.partition(rd, limit - 1)[limit - 1] if limit else -np.inf
+        order = np.nonzero(rd <= kth)[0]
+        order = order[np.lexsort((src[order], rd[order]))][:limit]
+    else:
+        order = np.lexsort((src, rd))
+        if limit is not None:
+            order = order[:limit]
+
+    return _frozen(idx[order]), _frozen(d[order])
+
+
 @tool
 def events_near_location(
     lat: float,
@@ -251,6 +622,7 @@ def events_near_location(
     radius_km: float = 20.0,
     start_year: int | None = None,
     end_year: int | None = None,
+    limit: int | None = None,
 ) -> dict:
     """
     Retrieve historical events near a coordinate.
@@ -267,6 +639,8 @@ def events_near_location(
         Minimum year filter
     end_year
         Maximum year filter
+    limit
+        Max number of events (nearest first); all when omitted
 
     Returns
     -------
@@ -274,24 +648,14 @@ def events_near_location(
 
     Behavior
     --------
-    Computes distance for each event and returns those that
-    fall inside the search radius.
+    Returns the events that fall inside the search radius, nearest
+    first. Repeat queries are served from an LRU cache.
     """
-    # Apply year filter
-    events = HistoricalTimelineServer._filter_years(
-        HistoricalTimelineServer.EVENTS, start_year, end_year
-    )
-
-    results = []
-    for ev in events:
-        d = HistoricalTimelineServer._distance_km(lat, lon, ev["lat"], ev["lon"])
-        if d <= radius_km:
-            entry = dict(ev)
-            entry["distance_km"] = round(d, 3)
-            results.append(entry)
-
-    # Sort by nearest event
-    results.sort(key=lambda x: x["distance_km"])
+    idxs, dists = _events_near_location_impl(lat, lon, radius_km, start_year, end_year, limit)
+
+    events = HistoricalTimelineServer.EVENTS
+    rounded = np.round(dists, 3).tolist()
+    results = [{**events[i], "distance_km": rounded[k]} for k, i in enumerate(idxs)]
 
     return {
         "query": {"lat": lat, "lon": lon, "radius_km": radius_km},
@@ -299,6 +663,43 @@ def events_near_location(
     }
 
 
+@functools.lru_cache(maxsize=1024)
+def _region_timeline_impl(r, start_year, end_year):
+    """
+    Find events for a region (memoized core of region_timeline).
+
+    Input
+    -----
+    r
+        Lowercased region name
+    start_year, end_year
+        Year filters (None for open-ended)
+
+    Returns
+    -------
+    Tuple of EVENTS indices in chronological order
+
+    Behavior
+    --------
+    Uses the precomputed region index; an exact name is a single dict
+    hit, otherwise the query is matched against the precomputed
+    lowercase region column.
+    """
+    hts = HistoricalTimelineServer
+    idxs = hts._REGION_INDEX.get(r)
+    if idxs is not None:
+        idxs = hts._filter_years(np.asarray(idxs, dtype=np.intp), start_year, end_year)
+    else:
+        # Substring match against the interned lowercase names, combined
+        # with the year filter (index order is chronological order)
+        names = hts._REGION_LOWER
+        mask = np.fromiter((r in name for name in names), dtype=bool, count=len(names))
+        mask &= hts._year_mask(start_year, end_year)
+        idxs = np.nonzero(mask)[0]
+
+    return tuple(idxs.tolist())
+
+
 @tool
 def region_timeline(
     region_name: str,
@@ -326,25 +727,18 @@ def region_timeline(
 
     Behavior
     --------
-    Returns events whose region matches the query.
+    Returns events whose region matches the query, using the
+    precomputed region index. Repeat queries are served from an LRU
+    cache.
     """
-    r = region_name.lower()
-
-    # Match region
-    matches = [
-        ev for ev in HistoricalTimelineServer.EVENTS
-        if r in ev["region"].lower()
-    ]
-
-    # Apply year filters
-    matches = HistoricalTimelineServer._filter_years(matches, start_year, end_year)
-
-    # Sort by chronological order
-    matches.sort(key=lambda x: x["year"])
+    idxs = _region_timeline_impl(region_name.lower(), start_year, end_year)
 
     # Apply limit
     if limit is not None:
-        matches = matches[:limit]
+        idxs = idxs[:limit]
+
+    events = HistoricalTimelineServer.EVENTS
+    matches = [events[i] for i in idxs]
 
     return {"region": region_name, "timeline": matches}
 
@@ -370,8 +764,9 @@ def route_history_summary(
 
     Behavior
     --------
-    Identifies all events near the travel corridor and
-    generates a narrative summary across historical eras.
+    Identifies all events within the corridor around the route's
+    great-circle segments and generates a narrative summary across
+    historical eras.
     """
     # Reject short routes
     if len(path) < 2:
@@ -381,43 +776,24 @@ def route_history_summary(
             "path_length_km": 0,
         }
 
-    # Compute route length
-    total = 0.0
-    for i in range(len(path) - 1):
-        lat1, lon1 = path[i]
-        lat2, lon2 = path[i + 1]
-        total += HistoricalTimelineServer._distance_km(lat1, lon1, lat2, lon2)
-
-    # Find nearby events
-    nearby = []
-    for ev in HistoricalTimelineServer.EVENTS:
-        # Compute closest point distance along the path
-        closest = min(
-            HistoricalTimelineServer._distance_km(lat, lon, ev["lat"], ev["lon"])
-            for lat, lon in path
-        )
-        if closest <= corridor_km:
-            entry = dict(ev)
-            entry["distance_to_route_km"] = round(closest, 3)
-            nearby.append(entry)
-
-    # Sort historically
-    nearby.sort(key=lambda x: x["year"])
+    # Route length and nearby events, already in historical order
+    # (EVENTS is year-sorted)
+    path_rad = np.radians(np.asarray(path, dtype=np.float64))
+    total, idxs, dists = _route_impl(path_rad, corridor_km)
+
+    events = HistoricalTimelineServer.EVENTS
+    rounded = np.round(dists, 3).tolist()
+    nearby = [{**events[i], "distance_to_route_km": rounded[k]} for k, i in enumerate(idxs)]
 
     # Build narrative
     if nearby:
-        regions = sorted({ev["region"] for ev in nearby})
+        regions = _regions_phrase(frozenset(HistoricalTimelineServer._REGION[idxs]))
         earliest = nearby[0]["year"]
         latest = nearby[-1]["year"]
 
-        summary = (
-            f"This route intersects historically significant regions including "
-            f"{', '.join(regions)}. Events span from {earliest} to {latest}, "
-            f"covering Phoenician, Hellenistic, Roman, Byzantine, Islamic, "
-            f"Mamluk, Ottoman, and modern Lebanese periods."
-        )
+        summary = _ROUTE_SUMMARY % (regions, earliest, latest)
     else:
-        summary = "No historical events fall within the specified corridor."
+        summary = _NO_EVENTS_SUMMARY
 
     return {
         "path_length_km": round(total, 3),